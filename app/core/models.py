@@ -59,6 +59,12 @@ class Tag(models.Model):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name'],
+                         name='core_tag_user_name_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -72,6 +78,12 @@ class Ingredient(models.Model):
     )
     name = models.CharField(max_length=225)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name'],
+                         name='core_ingredient_user_name_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
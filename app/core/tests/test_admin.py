@@ -5,23 +5,27 @@ from django.urls import reverse
 
 class AdminSiteTests(TestCase):
 
-    def setUp(self):
-        """function to set-up test case class before testing"""
-        self.client = Client()
+    @classmethod
+    def setUpTestData(cls):
+        """Create users once for the whole test case class"""
         # create admin user for test
-        self.admin_user = get_user_model().objects.create_superuser(
+        cls.admin_user = get_user_model().objects.create_superuser(
             email="admin@comgrow.com",
             password="admin123"
         )
-        # log admin in
-        self.client.force_login(self.admin_user)
         # create normal user for test
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email="test@comgrow.com",
             password="testing123",
             name="Test user full name"
         )
 
+    def setUp(self):
+        """function to set-up test case class before testing"""
+        self.client = Client()
+        # log admin in
+        self.client.force_login(self.admin_user)
+
     def test_users_listed(self):
         """Test that users are listed on user page"""
         url = reverse('admin:core_user_changelist')  # <app>:<url>
@@ -1,9 +1,38 @@
+from copy import copy, deepcopy
+
 from rest_framework import serializers
 
 from core.models import Tag, Ingredient, Recipe
 
 
-class TagSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Build serializer fields once per class and reuse shallow copies"""
+    _fields_cache = {}
+
+    def get_fields(self):
+        """Return a fresh copy of the cached fields for this class"""
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+
+        # copies are bound to this instance, the cached originals never are
+        return {
+            name: self._copy_field(field)
+            for name, field in self._fields_cache[cls].items()
+        }
+
+    @staticmethod
+    def _copy_field(field):
+        """Return a copy of a cached field that is safe to bind"""
+        # nested serializers and many related fields hold a child bound to
+        # the field itself, deepcopy rebuilds them so the child is bound to
+        # the copy and sees this serializer's context
+        if hasattr(field, 'child') or hasattr(field, 'child_relation'):
+            return deepcopy(field)
+        return copy(field)
+
+
+class TagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for tag objects"""
 
     class Meta:
@@ -12,7 +41,7 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ('id',)
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class IngredientSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for the ingredient objects"""
 
     class Meta:
@@ -21,7 +50,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         read_only_fields = ('id',)
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class RecipeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for the recipe objects"""
     ingredients = serializers.PrimaryKeyRelatedField(
         many=True,
@@ -0,0 +1,61 @@
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from core.models import Tag, Ingredient
+
+
+def list_version_key(model, user_id):
+    """Return the key of the version counter of a user's list"""
+    return f'recipe:{model._meta.model_name}:list-version:{user_id}'
+
+
+def list_cache_key(model, user_id, version):
+    """Return the cache key for a version of a user's list"""
+    return f'recipe:{model._meta.model_name}:list:{user_id}:{version}'
+
+
+def _initial_version():
+    """Return a starting version that differs from any evicted one"""
+    return int(time.time() * 1000)
+
+
+def get_list_version(model, user_id):
+    """Return the current version of a user's list"""
+    key = list_version_key(model, user_id)
+    cache.add(key, _initial_version(), None)
+    return cache.get(key)
+
+
+def bump_list_version(model, user_id):
+    """Move a user's list to a new version, orphaning cached copies"""
+    key = list_version_key(model, user_id)
+    try:
+        cache.incr(key)
+    except ValueError:  # no version yet, or it was evicted
+        cache.add(key, _initial_version(), None)
+
+
+@receiver(pre_save, sender=Tag)
+@receiver(pre_save, sender=Ingredient)
+def remember_previous_owner(sender, instance, **kwargs):
+    """Record the stored owner so a change of user invalidates both lists"""
+    instance._previous_user_id = None
+    if instance.pk is not None:
+        instance._previous_user_id = sender.objects.filter(
+            pk=instance.pk
+        ).values_list('user_id', flat=True).first()
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Ingredient)
+@receiver(post_delete, sender=Ingredient)
+def invalidate_list_cache(sender, instance, **kwargs):
+    """Bump the owners' list versions whenever one of their objects changes"""
+    # covers the API, the admin and cascade deletes of the user
+    user_ids = {instance.user_id, getattr(instance, '_previous_user_id', None)}
+    for user_id in user_ids - {None}:
+        bump_list_version(sender, user_id)
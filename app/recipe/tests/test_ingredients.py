@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from django.test import TestCase
 
@@ -7,8 +8,6 @@ from rest_framework.test import APIClient
 
 from core.models import Ingredient
 
-from recipe.serializers import IngredientSerializer
-
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
 
@@ -28,31 +27,39 @@ class PublicIngredientsApiTests(TestCase):
 class PrivateIngredientsApiTests(TestCase):
     """Test the private ingredients API"""
 
-    def setUp(self):
-        # create API client
-        self.client = APIClient()
-
-        # create authorised user
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # create authorised user once for the whole class
+        cls.user = get_user_model().objects.create_user(
             'testuser@comgrow.org',
             'test_pass123'
         )
-        # authenticate user
-        self.client.force_authenticate(self.user)
+        # create API client and authenticate user once for the whole class
+        cls._client = APIClient()
+        cls._client.force_authenticate(cls.user)
+
+    def setUp(self):
+        cache.clear()  # ingredient lists are cached per user
+        self.client = self._client
 
     def test_retrieve_ingredients_list(self):
         """Test retrieving a list of ingredients"""
         # create dummy ingredients
-        Ingredient.objects.create(user=self.user, name='Kale')
-        Ingredient.objects.create(user=self.user, name='Salt')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Kale'),
+            Ingredient(user=self.user, name='Salt'),
+        ])
 
         # retrieve list of existing ingredients
         res = self.client.get(INGREDIENTS_URL)
 
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(len(res.data), 2)
+        # check ingredients are returned ordered by name, descending
+        self.assertEqual(
+            [ingredient['name'] for ingredient in res.data],
+            ['Salt', 'Kale']
+        )
 
     def test_ingredients_limited_to_user(self):
         """Test that only the ingredients for the authenticated user are returned"""
@@ -87,6 +94,26 @@ class PrivateIngredientsApiTests(TestCase):
         ).exists()
         self.assertTrue(exists)
 
+    def test_create_ingredient_refreshes_cached_list(self):
+        """Test creating an ingredient is reflected in a cached list"""
+        self.client.get(INGREDIENTS_URL)  # cache the empty list
+        self.client.post(INGREDIENTS_URL, {'name': 'Garlic'})
+
+        res = self.client.get(INGREDIENTS_URL)
+
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]['name'], 'Garlic')
+
+    def test_deleted_ingredient_removed_from_cached_list(self):
+        """Test deleting an ingredient outside the API refreshes the list"""
+        ingredient = Ingredient.objects.create(user=self.user, name='Mint')
+        self.client.get(INGREDIENTS_URL)  # cache the list
+        ingredient.delete()  # e.g. from the admin
+
+        res = self.client.get(INGREDIENTS_URL)
+
+        self.assertEqual(res.data, [])
+
     def test_create_ingredient_invalid(self):
         """Test that invalid ingredient is not created"""
         payload = {'name': ''}
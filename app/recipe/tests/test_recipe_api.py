@@ -1,5 +1,6 @@
 import tempfile
 import os
+from functools import lru_cache
 
 from PIL import Image
 
@@ -12,7 +13,7 @@ from rest_framework.test import APIClient
 
 from core.models import Recipe, Tag, Ingredient
 
-from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from recipe.serializers import RecipeDetailSerializer
 
 RECIPES_URL = reverse('recipe:recipe-list')
 
@@ -20,14 +21,21 @@ RECIPES_URL = reverse('recipe:recipe-list')
 # /api/recipe/recipes/<id>/
 
 
+@lru_cache(maxsize=None)
+def recipe_url_template(name):
+    """Reverse a recipe url once and return it as a format string"""
+    prefix, suffix = reverse(name, args=[0]).rsplit('/0/', 1)
+    return prefix + '/{}/' + suffix
+
+
 def image_upload_url(recipe_id):
     """Return url for recipe image upload"""
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+    return recipe_url_template('recipe:recipe-upload-image').format(recipe_id)
 
 
 def detail_url(recipe_id):
     """Return recipe detail url"""
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+    return recipe_url_template('recipe:recipe-detail').format(recipe_id)
 
 
 def sample_tag(user, name="Main course"):
@@ -40,15 +48,41 @@ def sample_ingredient(user, name="Cinnamon"):
     return Ingredient.objects.create(user=user, name=name)
 
 
-def sample_recipe(user, **params):
-    """Create and return a sample recipe"""
+def recipe_defaults(**params):
+    """Return the fields of a sample recipe"""
     defaults = {
         'title': 'Sample recipe',
         'time_minutes': 10,
         'price': 5.01
     }
     defaults.update(params)
-    return Recipe.objects.create(user=user, **defaults)
+    return defaults
+
+
+def sample_recipe(user, **params):
+    """Create and return a sample recipe"""
+    return Recipe.objects.create(user=user, **recipe_defaults(**params))
+
+
+def sample_recipes(user, count, **params):
+    """Create and return several sample recipes in a single query"""
+    defaults = recipe_defaults(**params)
+    return Recipe.objects.bulk_create(
+        [Recipe(user=user, **defaults) for _ in range(count)]
+    )
+
+
+def add_relations(recipes, tag, ingredient):
+    """Add a tag and an ingredient to each recipe in two queries"""
+    RecipeTag = Recipe.tags.through
+    RecipeTag.objects.bulk_create([
+        RecipeTag(recipe_id=recipe.id, tag_id=tag.id) for recipe in recipes
+    ])
+    RecipeIngredient = Recipe.ingredients.through
+    RecipeIngredient.objects.bulk_create([
+        RecipeIngredient(recipe_id=recipe.id, ingredient_id=ingredient.id)
+        for recipe in recipes
+    ])
 
 
 class PublicRecipeApiTests(TestCase):
@@ -67,32 +101,48 @@ class PublicRecipeApiTests(TestCase):
 class PrivateRecipeApiTests(TestCase):
     """Test privately available recipes"""
 
-    def setUp(self):
-        """Create and force authenticate a user"""
-        self.client = APIClient()
-
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create and force authenticate a user once for the whole class"""
+        cls.user = get_user_model().objects.create_user(
             'test@comgrow.org',
             'testpassword'
         )
-        self.client.force_authenticate(self.user)
+        cls._client = APIClient()
+        cls._client.force_authenticate(cls.user)
+
+    def setUp(self):
+        """Reuse the authenticated client"""
+        self.client = self._client
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes"""
-        # create dummy recipes
-        sample_recipe(self.user)  # create with defaults
-        sample_recipe(self.user)
-        sample_recipe(self.user)
+        tag = sample_tag(user=self.user)
+        ingredient = sample_ingredient(user=self.user)
 
-        res = self.client.get(RECIPES_URL)
-        # retrieve the list of recipes
-        recipes = Recipe.objects.all().order_by('-id')
-        # pass in recipes into serializer
-        serializer = RecipeSerializer(recipes, many=True)
+        # one recipe: query recipes, then prefetch tags and ingredients
+        add_relations(sample_recipes(self.user, 1), tag, ingredient)
+        with self.assertNumQueries(3):
+            self.client.get(RECIPES_URL)
+
+        # three recipes: still the same three queries
+        add_relations(sample_recipes(self.user, 2), tag, ingredient)
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
+
+        # retrieve the ids of the user's recipes, newest first
+        recipe_ids = Recipe.objects.filter(
+            user=self.user
+        ).order_by('-id').values_list('id', flat=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        # check data matches serializer that we created
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(len(res.data), 3)
+        # check the expected recipes are returned in order
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data],
+            list(recipe_ids)
+        )
+        self.assertEqual(res.data[0]['title'], 'Sample recipe')
 
     def test_recipes_limited_to_user(self):
         """Test only the user's recipes are retrieved"""
@@ -110,14 +160,16 @@ class PrivateRecipeApiTests(TestCase):
         # perform get
         res = self.client.get(RECIPES_URL)
 
-        # filter for authenticated user
-        recipes = Recipe.objects.filter(user=self.user)
-        # pass in returned queryset to our serializer
-        serializer = RecipeSerializer(recipes, many=True)
+        # filter ids for authenticated user
+        recipe_ids = Recipe.objects.filter(user=self.user).values_list(
+            'id', flat=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data],
+            list(recipe_ids)
+        )
+        self.assertEqual(res.data[0]['title'], params['title'])
 
     def test_view_recipe_detail(self):
         """Test viewing a recipe detail"""
@@ -0,0 +1,31 @@
+from django.test import TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+
+
+class CachedFieldsTests(TestCase):
+    """Test serializer fields built from the per class cache"""
+
+    def setUp(self):
+        request = APIRequestFactory().get('/api/recipe/recipes/')
+        self.context = {'request': request}
+
+    def test_nested_serializer_child_not_shared(self):
+        """Test nested serializers get their own child with the context"""
+        serializer = RecipeDetailSerializer(context=self.context)
+        other = RecipeDetailSerializer()
+
+        child = serializer.fields['tags'].child
+        self.assertIsNot(child, other.fields['tags'].child)
+        self.assertIs(child.context['request'], self.context['request'])
+
+    def test_related_field_child_not_shared(self):
+        """Test many related fields get their own child relation"""
+        serializer = RecipeSerializer(context=self.context)
+        other = RecipeSerializer()
+
+        child = serializer.fields['tags'].child_relation
+        self.assertIsNot(child, other.fields['tags'].child_relation)
+        self.assertIs(child.context['request'], self.context['request'])
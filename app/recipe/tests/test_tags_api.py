@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
 from django.urls import reverse
 from django.test import TestCase
 
@@ -7,8 +10,6 @@ from rest_framework.test import APIClient
 
 from core.models import Tag
 
-from recipe.serializers import TagSerializer
-
 TAGS_URL = reverse('recipe:tag-list')
 
 
@@ -28,26 +29,36 @@ class PublicTagsApitests(TestCase):
 class PrivateTagsApiTests(TestCase):
     """Test the authorized user tags API"""
 
-    def setUp(self):
-        # create authenticated user
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # create authenticated user once for the whole class
+        cls.user = get_user_model().objects.create_user(
             'test@comgrow.org',
             'testpass123'
         )
-        self.client = APIClient()  # create API client
-        self.client.force_authenticate(self.user)  # authenticate the user
+        cls._client = APIClient()  # create API client
+        cls._client.force_authenticate(cls.user)  # authenticate the user
+
+    def setUp(self):
+        cache.clear()  # tag lists are cached per user
+        self.client = self._client
 
     def test_retrieve_tags(self):
         """Test retrieving tags"""
-        Tag.objects.create(user=self.user, name='Vegan')
-        Tag.objects.create(user=self.user, name='Dessert')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert'),
+        ])
 
         res = self.client.get(TAGS_URL)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(len(res.data), 2)
+        # check tags are returned ordered by name, descending
+        self.assertEqual(
+            [tag['name'] for tag in res.data],
+            ['Vegan', 'Dessert']
+        )
 
     def test_tags_limited_to_user(self):
         """Test that tags returned are for the authenticated user"""
@@ -79,6 +90,48 @@ class PrivateTagsApiTests(TestCase):
 
         self.assertTrue(exists)
 
+    def test_create_tag_refreshes_cached_list(self):
+        """Test creating a tag is reflected in a previously cached list"""
+        self.client.get(TAGS_URL)  # cache the empty list
+        self.client.post(TAGS_URL, {'name': 'Breakfast'})
+
+        res = self.client.get(TAGS_URL)
+
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]['name'], 'Breakfast')
+
+    def test_tag_created_while_caching_list_is_not_lost(self):
+        """Test a write between reading and caching the list is not lost"""
+        backend = caches['default']
+        cache_set = backend.set
+
+        def create_tag_then_set(*args, **kwargs):
+            # the list was read from the db before this tag existed
+            Tag.objects.create(user=self.user, name='Brunch')
+            return cache_set(*args, **kwargs)
+
+        with patch.object(backend, 'set', side_effect=create_tag_then_set):
+            self.client.get(TAGS_URL)
+
+        res = self.client.get(TAGS_URL)
+
+        self.assertEqual([tag['name'] for tag in res.data], ['Brunch'])
+
+    def test_tag_moved_to_other_user_leaves_cached_list(self):
+        """Test changing a tag's user refreshes the previous owner's list"""
+        user2 = get_user_model().objects.create_user(
+            'other@comgrow.com',
+            'testpass'
+        )
+        tag = Tag.objects.create(user=self.user, name='Snack')
+        self.client.get(TAGS_URL)  # cache the list with the tag
+        tag.user = user2  # e.g. from the admin
+        tag.save()
+
+        res = self.client.get(TAGS_URL)
+
+        self.assertEqual(res.data, [])
+
     def test_create_tag_invalid(self):
         """Test creating a new tag with invalid payload"""
         payload = {'name': ''}
@@ -1,3 +1,7 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import viewsets, mixins, status
@@ -6,6 +10,7 @@ from rest_framework.permissions import IsAuthenticated
 
 from core.models import Tag, Ingredient, Recipe
 from recipe import serializers
+from recipe.signals import list_cache_key, get_list_version
 
 
 class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
@@ -14,27 +19,51 @@ class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
     """Base viewset for other recipe attributes"""
     authentication_classes = (TokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    list_cache_timeout = 60  # seconds
+
+    def list(self, request, *args, **kwargs):
+        """Return the cached list for the user, building it if missing
+
+        The signal handlers in recipe.signals bump the list version on
+        save and delete. bulk_create and QuerySet.update() send no
+        signals, so a cached list can miss those writes until it expires.
+        """
+        model = self.queryset.model
+        # read the version before the rows so a concurrent write makes
+        # this request cache under an already stale version
+        version = get_list_version(model, request.user.id)
+        key = list_cache_key(model, request.user.id, version)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, self.list_cache_timeout)
+
+        return Response(data)
 
     def get_queryset(self):
         """Return objects for the current authenticated user only"""
-        return self.queryset.filter(user=self.request.user).order_by('-name')
+        # build from the manager rather than cloning the class queryset;
+        # serializers only expose id and name, so skip the other columns
+        return self.queryset.model.objects.filter(
+            user=self.request.user
+        ).only('id', 'name').order_by('-name')
 
     # override default method
     def perform_create(self, serializer):
-        """Create a new tag"""
+        """Create a new object"""
         serializer.save(
             user=self.request.user)  # set user to authenitcated user
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
-    """Manage ingredients in the database"""
-    queryset = Tag.objects.all()
+    """Manage tags in the database"""
+    queryset = Tag.objects.none()  # sets the model for the router
     serializer_class = serializers.TagSerializer
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
     """Manage ingredients in the database"""
-    queryset = Ingredient.objects.all()
+    queryset = Ingredient.objects.none()  # sets the model for the router
     serializer_class = serializers.IngredientSerializer
 
 
@@ -47,7 +76,17 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Retrieve recipes for the authenticated user"""
-        return self.queryset.filter(user=self.request.user)
+        # prefetch m2m relations to avoid N+1 queries,
+        # nested serializers only need the id and name of each relation
+        return self.queryset.filter(
+            user=self.request.user
+        ).prefetch_related(
+            Prefetch('tags', queryset=Tag.objects.only('id', 'name')),
+            Prefetch(
+                'ingredients',
+                queryset=Ingredient.objects.only('id', 'name')
+            ),
+        ).order_by('-id')
 
     def get_serializer_class(self):
         """return appropriate serializer class"""
@@ -60,7 +99,24 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Create a new recipe with user assigned to current user"""
-        serializer.save(user=self.request.user)
+        tags = serializer.validated_data.pop('tags', [])
+        ingredients = serializer.validated_data.pop('ingredients', [])
+        RecipeTag = Recipe.tags.through
+        RecipeIngredient = Recipe.ingredients.through
+
+        # save the recipe and its relations together or not at all
+        with transaction.atomic():
+            recipe = serializer.save(user=self.request.user)
+
+            # insert the m2m rows in one query per relation, not per row
+            RecipeTag.objects.bulk_create([
+                RecipeTag(recipe_id=recipe.id, tag_id=tag_id)
+                for tag_id in {tag.id for tag in tags}
+            ])
+            RecipeIngredient.objects.bulk_create([
+                RecipeIngredient(recipe_id=recipe.id, ingredient_id=i_id)
+                for i_id in {ingredient.id for ingredient in ingredients}
+            ])
 
     @action(methods=['POST'], detail=True, url_path='upload-image')
     def upload_image(self, request, pk=None):